@@ -6,9 +6,17 @@ Combines ryven, ipywidgets/ipycanvas, and pyiron to facilitate visual scripting
 """
 
 import ironflow.node_tools
-from ironflow.gui.gui import GUI
 
 from ._version import get_versions
 
 __version__ = get_versions()["version"]
 del get_versions
+
+
+def __getattr__(name):
+    # Defer building the whole gui stack until someone actually asks for it
+    if name == "GUI":
+        from ironflow.gui.gui import GUI
+
+        return GUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
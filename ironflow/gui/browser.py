@@ -9,9 +9,6 @@ from __future__ import annotations
 
 import ipywidgets as widgets
 
-from pyiron_atomistics import Project
-from pyiron_gui import ProjectBrowser
-
 from ironflow.gui.draws_widgets import DrawsWidgets
 
 
@@ -19,6 +16,10 @@ class BrowserGUI(DrawsWidgets):
     main_widget_class = widgets.VBox
 
     def __init__(self, *args, **kwargs):
+        # These are heavy imports, so only pay for them once a browser is actually made
+        from pyiron_atomistics import Project
+        from pyiron_gui import ProjectBrowser
+
         super().__init__(*args, **kwargs)
         # self.widget = self.main_widget_class([])
         self.top_level_project = Project(".")
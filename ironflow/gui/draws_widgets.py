@@ -39,13 +39,12 @@ def draws_widgets(fnc: Callable) -> Callable:
     """
 
     def wrapper(self, *args, **kwargs):
-        n_widgets_i = len(widgets.Widget.widgets)
+        widget_ids_i = set(widgets.Widget.widgets.keys())
         result = fnc(self, *args, **kwargs)
-        n_widgets_drawn = len(widgets.Widget.widgets) - n_widgets_i
-        if n_widgets_drawn > 0:
-            self._drawn_widgets += list(widgets.Widget.widgets.values())[
-                -n_widgets_drawn:
-            ]
+        # Compare ids rather than counts, since the method may also close widgets
+        self._drawn_widgets += [
+            w for k, w in widgets.Widget.widgets.items() if k not in widget_ids_i
+        ]
         return result
 
     return wrapper
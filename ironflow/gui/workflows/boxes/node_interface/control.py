@@ -7,12 +7,16 @@ For directly controlling node IO (as opposed to giving it to nodes by connecting
 
 from __future__ import annotations
 
-import pickle
-import base64
+import asyncio
+from copy import deepcopy
+from functools import lru_cache, partial, wraps
+from itertools import chain
+from operator import is_
 from typing import TYPE_CHECKING, Callable
 
 import ipywidgets as widgets
-import numpy as np
+from ryvencore import Node as NodeCore
+from ryvencore.Base import Base
 from ryvencore.InfoMsgs import InfoMsgs
 from traitlets import TraitError
 
@@ -24,10 +28,137 @@ if TYPE_CHECKING:
     from ipywidgets import DOMWidget
     from ironflow.gui.workflows.screen import WorkflowsGUI
     from ironflow.model.node import Node
+    from ironflow.model.port import NodeInput
 
 
-def deserialize(data):
-    return pickle.loads(base64.b64decode(data))
+# Layouts are widgets in their own right, and identical for every row, so rows share them
+_LAYOUT_INPUT = widgets.Layout(width="100px")
+_LAYOUT_BATCH = widgets.Layout(width="75px")
+_LAYOUT_RESET = widgets.Layout(width="30px")
+_LAYOUT_LABEL = widgets.Layout()
+_LAYOUT_ROW = widgets.Layout(height="30px")
+
+
+@lru_cache(maxsize=None)
+def _node_caps(node_class: type) -> tuple[bool, bool, bool]:
+    """
+    Which of `(inputs, GLOBAL_ID, input_widget)` nodes of this class have.
+
+    The first two are only set in the ryvencore init, so we infer them from the class
+    hierarchy rather than checking each instance.
+    """
+    return (
+        issubclass(node_class, NodeCore),
+        issubclass(node_class, Base),
+        hasattr(node_class, "input_widget"),
+    )
+
+
+def _debounce(wait_ms: int) -> Callable:
+    """
+    A decorator for methods that only need their effect from the last of a rapid burst
+    of calls, e.g. redrawing after every tick of a widget value.
+
+    Each call cancels any pending call (on the same instance) and reschedules it for
+    `wait_ms` milliseconds later on the running event loop. When no loop is running
+    (e.g. outside a kernel) the method is just called immediately.
+    """
+
+    def decorator(fnc: Callable) -> Callable:
+        @wraps(fnc)
+        def wrapper(self, *args, **kwargs):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return fnc(self, *args, **kwargs)
+
+            pending = self.__dict__.setdefault("_debounced_calls", {})
+            handle = pending.pop(fnc.__name__, None)
+            if handle is not None:
+                handle.cancel()
+            pending[fnc.__name__] = loop.call_later(
+                wait_ms / 1000, lambda: fnc(self, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def _int_text(
+    make: Callable, inp: NodeInput, disabled: bool, layout: widgets.Layout
+) -> widgets.IntText:
+    return make(
+        widgets.IntText,
+        layout,
+        value=inp.val,
+        description="",
+        continuous_update=False,
+        disabled=disabled,
+    )
+
+
+def _float_text(
+    make: Callable, inp: NodeInput, disabled: bool, layout: widgets.Layout
+) -> widgets.FloatText:
+    return make(
+        widgets.FloatText,
+        layout,
+        value=inp.val,
+        description="",
+        continuous_update=False,
+        disabled=disabled,
+    )
+
+
+def _checkbox(
+    make: Callable, inp: NodeInput, disabled: bool, layout: widgets.Layout
+) -> widgets.Checkbox:
+    return make(
+        widgets.Checkbox,
+        layout,
+        value=inp.val,
+        indent=False,
+        description="",
+        disabled=disabled,
+    )
+
+
+def _dropdown(
+    make: Callable, inp: NodeInput, disabled: bool, layout: widgets.Layout
+) -> widgets.Dropdown:
+    return make(
+        widgets.Dropdown,
+        layout,
+        options=inp.dtype.items,  # Before value, so recycled widgets accept the value
+        value=inp.val,
+        description="",
+        ensure_option=True,
+        disabled=disabled,
+    )
+
+
+def _text(
+    make: Callable, inp: NodeInput, disabled: bool, layout: widgets.Layout
+) -> widgets.Text:
+    return make(
+        widgets.Text,
+        layout,
+        value=str(inp.val),
+        continuous_update=False,
+        disabled=disabled,
+    )
+
+
+_WIDGET_FACTORIES: dict[
+    str, Callable[[Callable, NodeInput, bool, widgets.Layout], widgets.DOMWidget]
+] = {
+    "Integer": _int_text,
+    "Float": _float_text,
+    "Boolean": _checkbox,
+    "Choice": _dropdown,
+    "String": _text,
+}
 
 
 class NodeController(DrawsWidgets):
@@ -36,6 +167,19 @@ class NodeController(DrawsWidgets):
     """
 
     main_widget_class = widgets.VBox
+    _max_pooled_widgets = 50  # Per widget class and layout
+    _max_visible_rows = 10  # Longer input lists get paged through
+
+    # Styling, as class attributes so specializations can override them
+    _border = "1px solid black"
+    _input_border = "solid 1px blue"
+    _info_border = "solid 1px red"
+    _row_height = 30  # px
+    _input_layout = _LAYOUT_INPUT
+    _batch_layout = _LAYOUT_BATCH
+    _reset_layout = _LAYOUT_RESET
+    _label_layout = _LAYOUT_LABEL
+    _row_layout = _LAYOUT_ROW
 
     def __new__(cls, screen: WorkflowsGUI, *args, **kwargs):
         return super().__new__(cls, *args, **kwargs)
@@ -44,18 +188,57 @@ class NodeController(DrawsWidgets):
         super().__init__(*args, **kwargs)
         self.screen = screen
         self.node = None
-        self._row_height = 30  # px
+        self._row_cache: dict[
+            tuple[int, int],
+            tuple[
+                tuple[str, bool],
+                tuple[widgets.Label, DOMWidget, widgets.ToggleButton, widgets.Button],
+            ],
+        ] = {}
+        self._input_box = None
+        self._info_box = None
+        self._input_widget_cache: dict[int, widgets.Widget] = {}
+        self._syncing_widgets = False
+        self._widget_pool: dict[tuple, list[DOMWidget]] = {}
+        # One handler per kind of row widget, the row comes from the widget itself
+        self._on_input_change = partial(self._on_any_change, kind="input")
+        self._on_batch_toggle = partial(self._on_any_change, kind="batch")
+        self._on_reset_click = partial(self._on_any_change, kind="reset")
+        self._window_start = 0
+        self._n_inputs = 0
+        self._drawn_signature = None
+
+        self._rows_up = widgets.Button(
+            icon="chevron-up",
+            tooltip="Previous inputs",
+            layout=self._reset_layout,
+        )
+        self._rows_up.on_click(partial(self._scroll_inputs, -1))
+        self._rows_down = widgets.Button(
+            icon="chevron-down",
+            tooltip="Next inputs",
+            layout=self._reset_layout,
+        )
+        self._rows_down.on_click(partial(self._scroll_inputs, 1))
+        self._rows_label = widgets.Label()
+        self._pager = widgets.HBox([self._rows_up, self._rows_label, self._rows_down])
 
-        self._border = "1px solid black"
         self.widget.layout = widgets.Layout(
             width="50%",
             border="",
             max_height="360px",
+            overflow="auto",
             margin="10px",
             padding="5px",
         )
 
     def draw_for_node(self, node: Node | None) -> None:
+        if (
+            node is not None
+            and node is self.node
+            and self._same_signature(self._signature(node), self._drawn_signature)
+        ):
+            return  # E.g. the same node got clicked again, nothing would change
         self.clear()
         self.node = node
         if self.node is not None:
@@ -67,217 +250,529 @@ class NodeController(DrawsWidgets):
 
     @draws_widgets
     def draw(self) -> None:
-        self.widget.children = [
-            self._draw_input_box(),
-            self._draw_input_widget(),
-            self._draw_info_box(),
-        ]
-        self.widget.layout.border = self._border
+        with self.widget.hold_sync():
+            children = [
+                self._draw_input_box(),
+                *self._draw_pager(),
+                self._draw_input_widget(),
+                self._draw_info_box(),
+            ]
+            if list(self.widget.children) != children:
+                # Re-assigning children re-mounts the views on the frontend, so only
+                # do it when the actual widget instances change
+                self.widget.children = children
+            self.widget.layout.border = self._border
+        self._drawn_signature = self._signature(self.node)
         return self.widget
 
+    @staticmethod
+    def _signature(node: Node) -> tuple:
+        """
+        A cheap fingerprint of what the controls for a node depend on: the input values
+        themselves, and everything else about the inputs.
+
+        The values are held on to (rather than e.g. their `id`, which can be reused once
+        they're freed) to be compared by identity, as they need not be comparable.
+        """
+        if not _node_caps(type(node))[0]:
+            return (), ()
+        return tuple(inp.val for inp in node.inputs), (
+            node.block_updates,
+            tuple(
+                (
+                    inp.dtype.batched if inp.dtype is not None else False,
+                    len(inp.connections),
+                )
+                for inp in node.inputs
+            ),
+        )
+
+    @staticmethod
+    def _same_signature(signature: tuple, other: tuple | None) -> bool:
+        # Values by identity, so in-place mutations of a value are not picked up
+        if other is None:
+            return False
+        values, rest = signature
+        other_values, other_rest = other
+        return (
+            rest == other_rest
+            and len(values) == len(other_values)
+            and all(map(is_, values, other_values))
+        )
+
     def _draw_input_widget(self) -> widgets.Widget:
-        try:
-            widget = self.node.input_widget(self.screen, self.node).widget
-            widget.layout.height = "70px"
-            widget.layout.border = "solid 1px blue"
-            return widget
-        except AttributeError:
-            return widgets.Output()
+        widget = self._input_widget_cache.get(id(self.node))
+        if widget is None:
+            if _node_caps(type(self.node))[2]:
+                try:
+                    widget = self.node.input_widget(self.screen, self.node).widget
+                    widget.layout.height = "70px"
+                    widget.layout.border = self._input_border
+                except AttributeError:
+                    widget = None
+            if widget is None:
+                widget = widgets.Output()
+            self._input_widget_cache[id(self.node)] = widget
+        return widget
 
     def _input_field_list(self) -> list[list[widgets.Widget]]:
+        """
+        Rows for the inputs in the current window; widgets of rows outside the window
+        are released for recycling rather than kept around.
+        """
         input = []
-        if hasattr(self.node, "inputs"):
-            for i_c, inp in enumerate(self.node.inputs[:]):
-                dtype = str(inp.dtype).split(".")[-1]
-                disabled = self.node.block_updates or len(inp.connections) > 0
+        has_inputs = _node_caps(type(self.node))[0]
+        self._n_inputs = len(self.node.inputs) if has_inputs else 0
+        window = self._input_window()
+        for key in [k for k in self._row_cache if k[1] not in window]:
+            # Scrolled out of view, or the node lost inputs since the last draw
+            # Release these first, so the rows coming into view can recycle them
+            self._release_row(self._row_cache.pop(key)[1])
+        if has_inputs:
+            for i_c in window:
+                inp = self.node.inputs[i_c]
+                dtype_name = type(inp.dtype).__name__
+                has_connections = len(inp.connections) > 0
+                disabled = self.node.block_updates or has_connections
                 try:
-                    dtype_state = deserialize(inp.data()["dtype state"])
-                except TypeError:
-                    # `inp.data()` winds up calling `serialize` on `inp.get_val()`
-                    # This serialization is a pickle dump, which fails with structures (`Atoms`)
-                    # Just gloss over it for now
-                    dtype_state = {
-                        "val": "Serialization error -- please reconnect an input"
-                    }
+                    default, batched = inp.dtype.default, inp.dtype.batched
+                except AttributeError:
+                    default, batched = None, False
                 if inp.val is None:
-                    inp.val = dtype_state["val"]
-
-                try:
-                    if dtype_state["batched"]:
-                        inp_widget = widgets.Text(
-                            f"Batched {dtype}",
-                            continuous_update=False,
-                            disabled=True,
-                        )
-                    elif dtype == "Integer":
-                        inp_widget = widgets.IntText(
-                            value=inp.val,
-                            description="",
-                            continuous_update=False,
-                            disabled=disabled,
-                        )
-                    elif dtype == "Float":
-                        inp_widget = widgets.FloatText(
-                            value=inp.val,
-                            description="",
-                            continuous_update=False,
-                            disabled=disabled,
-                        )
-                    elif dtype == "Boolean":
-                        inp_widget = widgets.Checkbox(
-                            value=inp.val,
-                            indent=False,
-                            description="",
-                            disabled=disabled,
-                        )
-                    elif dtype == "Choice":
-                        inp_widget = widgets.Dropdown(
-                            value=inp.val,
-                            options=inp.dtype.items,
-                            description="",
-                            ensure_option=True,
-                            disabled=disabled,
-                        )
-                    elif dtype == "String" or dtype == "Char":
-                        inp_widget = widgets.Text(
-                            value=str(inp.val),
-                            continuous_update=False,
-                            disabled=disabled,
-                        )
-                    else:
-                        inp_widget = widgets.Text(
-                            value=str(inp.val), continuous_update=False, disabled=True
-                        )
-                except TraitError as e:
-                    inp_widget = widgets.Label(
-                        value="Trait error -- check log and/or change input."
+                    inp.val = deepcopy(default)
+
+                key = (id(self.node), i_c)
+                cached = self._row_cache.get(key)
+                if (
+                    cached is not None
+                    and cached[0] == (dtype_name, batched)
+                    and self._update_row(
+                        cached[1], inp, dtype_name, batched, disabled, has_connections
                     )
-                    InfoMsgs.write_err(e)
-
-                description = inp.label_str if inp.label_str != "" else inp.type_
-                inp_widget.layout.width = "100px"
-                inp_widget.observe(self._input_change_i(i_c), names="value")
-
-                batch_button = widgets.ToggleButton(
-                    description="Batched",
-                    tooltip="Use batches batches of correctly typed data instead of "
-                    "instances",
-                    layout=widgets.Layout(width="75px"),
-                    disabled=inp.dtype is None
-                    or not isinstance(inp.node, BatchingNode),
-                    value=inp.dtype.batched if hasattr(inp, "dtype") else False,
-                )
-                batch_button.observe(self._toggle_batching_i(i_c), names="value")
-
-                reset_button = widgets.Button(
-                    tooltip="Reset to default",
-                    icon="refresh",
-                    layout=widgets.Layout(width="30px"),
-                    disabled=len(inp.connections) > 0,
-                )
-                reset_button.on_click(self._input_reset_i(i_c, inp_widget))
+                ):
+                    row = cached[1]
+                else:
+                    if cached is not None:
+                        self._release_row(cached[1])
+                    row = self._build_row(
+                        i_c, inp, dtype_name, batched, disabled, has_connections
+                    )
+                    self._row_cache[key] = ((dtype_name, batched), row)
+                input.append(list(row))
 
-                input.append(
-                    [widgets.Label(description), inp_widget, batch_button, reset_button]
-                )
         return input
 
-    def _input_change_i(self, i_c) -> Callable:
-        def input_change(change: dict) -> None:
-            # Todo: Test this in exec mode
-            self.node.inputs[i_c].update(change["new"])
-            # self.node.update(i_c)
-            self.screen.redraw_active_flow_canvas()
+    def _input_window(self) -> range:
+        self._window_start = max(
+            0, min(self._window_start, self._n_inputs - self._max_visible_rows)
+        )
+        return range(
+            self._window_start,
+            min(self._n_inputs, self._window_start + self._max_visible_rows),
+        )
 
-        return input_change
+    def _scroll_inputs(self, direction: int, button: widgets.Button) -> None:
+        self._window_start += direction * self._max_visible_rows
+        self.draw()
 
-    def _toggle_batching_i(self, i_c) -> Callable:
-        def toggle_batching(change: dict) -> None:
-            try:
-                InfoMsgs.write(
-                    f"Batching for {self.node.title}.{self.node.inputs[i_c].label_str} "
-                    f"set to {change['new']}"
+    def _draw_pager(self) -> list[widgets.HBox]:
+        if self._n_inputs <= self._max_visible_rows:
+            return []
+        window = self._input_window()
+        self._rows_label.value = (
+            f"Inputs {window.start + 1}-{window.stop} of {self._n_inputs}"
+        )
+        self._rows_up.disabled = window.start == 0
+        self._rows_down.disabled = window.stop == self._n_inputs
+        return [self._pager]
+
+    def _build_row(
+        self,
+        i_c: int,
+        inp: NodeInput,
+        dtype_name: str,
+        batched: bool,
+        disabled: bool,
+        has_connections: bool,
+    ) -> tuple[widgets.Label, DOMWidget, widgets.ToggleButton, widgets.Button]:
+        input_layout = self._input_layout
+        try:
+            if batched:
+                inp_widget = self._make_widget(
+                    widgets.Text,
+                    input_layout,
+                    value=f"Batched {dtype_name}",
+                    continuous_update=False,
+                    disabled=True,
                 )
-                if change["new"]:
-                    self.node.inputs[i_c].batch()
-                else:
-                    self.node.inputs[i_c].unbatch()
-                self.screen.redraw_active_flow_canvas()
-                self.draw()
-            except AttributeError:
-                pass
-
-        return toggle_batching
-
-    def _input_reset_i(self, i_c, associated_input_field) -> Callable:
-        def input_reset(button: widgets.Button) -> None:
-            default = self.node.inputs[i_c].dtype.default
-            self.node.inputs[i_c].update(default)
-            InfoMsgs.write(
-                f"Value for {self.node.title}.{self.node.inputs[i_c].label_str} "
-                f"reset to {default}"
+            elif dtype_name in _WIDGET_FACTORIES:
+                inp_widget = _WIDGET_FACTORIES[dtype_name](
+                    self._make_widget, inp, disabled, input_layout
+                )
+            else:
+                inp_widget = self._make_widget(
+                    widgets.Text,
+                    input_layout,
+                    value=str(inp.val),
+                    continuous_update=False,
+                    disabled=True,
+                )
+        except TraitError as e:
+            inp_widget = self._make_widget(
+                widgets.Label,
+                input_layout,
+                value="Trait error -- check log and/or change input.",
             )
+            InfoMsgs.write_err(e)
+
+        description = inp.label_str if inp.label_str != "" else inp.type_
+        inp_widget._ironflow_row = i_c
+        self._connect(inp_widget, self._on_input_change)
+
+        batch_button = self._make_widget(
+            widgets.ToggleButton,
+            self._batch_layout,
+            description="Batched",
+            tooltip="Use batches batches of correctly typed data instead of "
+            "instances",
+            disabled=inp.dtype is None or not isinstance(inp.node, BatchingNode),
+            value=inp.dtype.batched if inp.dtype is not None else False,
+        )
+        batch_button._ironflow_row = i_c
+        self._connect(batch_button, self._on_batch_toggle)
+
+        reset_button = self._make_widget(
+            widgets.Button,
+            self._reset_layout,
+            tooltip="Reset to default",
+            icon="refresh",
+            disabled=has_connections,
+        )
+        reset_button._ironflow_row = i_c
+        self._connect(reset_button, self._on_reset_click)
+
+        label = self._make_widget(widgets.Label, self._label_layout, value=description)
+        return label, inp_widget, batch_button, reset_button
+
+    def _make_widget(
+        self, widget_class: type[DOMWidget], layout: widgets.Layout, **traits
+    ) -> DOMWidget:
+        """
+        Get a widget, recycling a previously released one of the same class and layout
+        when possible (which is much cheaper than instantiating a new one).
+
+        Note:
+            Recycling widgets (instead of e.g. `copy.copy`-ing a prototype) matters, as
+            copies share their comm with the original, i.e. they are the same widget as
+            far as the frontend is concerned.
+        """
+        key = (widget_class, id(layout))
+        pool = self._widget_pool.get(key)
+        if pool:
+            widget = pool.pop()
+            self._drawn_widgets += self._widget_parts(widget)
+            syncing, self._syncing_widgets = self._syncing_widgets, True
             try:
-                associated_input_field.value = default
+                with widget.hold_sync():
+                    for name, value in traits.items():
+                        if widget.has_trait(name):
+                            self._set_trait(widget, name, value)
             except TraitError:
-                self.screen.update_node_control()
+                self._close_widget(widget)
+                raise
             finally:
-                pass
-            self.node.update(i_c)
+                self._syncing_widgets = syncing  # Still connected to its old row
+        else:
+            widget = widget_class(layout=layout, **traits)
+        widget._ironflow_pool_key = key
+        return widget
+
+    @staticmethod
+    def _set_trait(widget: widgets.Widget, name: str, value) -> None:
+        """
+        Assign a trait the way the widget constructor would, i.e. `None` falls back to
+        the trait's default when the trait doesn't allow `None` (e.g. for numeric
+        inputs without a value yet).
+        """
+        if value is None:
+            trait = widget.traits()[name]
+            if not trait.allow_none:
+                value = trait.default()
+        setattr(widget, name, value)
+
+    @staticmethod
+    def _connect(widget: DOMWidget, callback: Callable) -> None:
+        """
+        Hook a row widget up to its change handler. Recycled widgets stay hooked up, so
+        this only does any work for new widgets.
+        """
+        if widget.__dict__.get("_ironflow_observed", False):
+            return
+        if isinstance(widget, widgets.Button):
+            widget.on_click(callback)
+        else:
+            widget.observe(callback, names="value")
+        widget._ironflow_callback = callback
+        widget._ironflow_observed = True
+
+    @staticmethod
+    def _disconnect(widget: widgets.Widget) -> None:
+        if not widget.__dict__.pop("_ironflow_observed", False):
+            return
+        callback = widget.__dict__.pop("_ironflow_callback")
+        if isinstance(widget, widgets.Button):
+            widget.on_click(callback, remove=True)
+        else:
+            widget.unobserve(callback, names="value")
+
+    def _release_row(self, row: tuple[widgets.Widget, ...]) -> None:
+        for widget in row:
+            self._release_widget(widget)
+
+    def _release_widget(self, widget: DOMWidget) -> None:
+        """
+        Detach a widget from its row and hold on to it so it can be recycled, closing it
+        instead if we're already holding enough of its kind.
+        """
+        pool = self._widget_pool.setdefault(widget._ironflow_pool_key, [])
+        if len(pool) >= self._max_pooled_widgets:
+            self._close_widget(widget)
+        else:
+            pool.append(widget)
+            for part in self._widget_parts(widget):
+                try:
+                    self._drawn_widgets.remove(part)  # Don't let `clear` close it
+                except ValueError:
+                    pass
+
+    @staticmethod
+    def _widget_parts(widget: DOMWidget) -> list[widgets.Widget]:
+        # Not the layout, which is shared
+        return [w for w in (widget, getattr(widget, "style", None)) if w is not None]
+
+    def _update_row(
+        self,
+        row: tuple[widgets.Label, DOMWidget, widgets.ToggleButton, widgets.Button],
+        inp: NodeInput,
+        dtype_name: str,
+        batched: bool,
+        disabled: bool,
+        has_connections: bool,
+    ) -> bool:
+        """
+        Bring an existing row in line with its input port by mutating the widgets
+        instead of rebuilding them.
+
+        Returns:
+            (bool): Whether the row could be updated, otherwise it needs rebuilding.
+        """
+        label, inp_widget, batch_button, reset_button = row
+        if isinstance(inp_widget, widgets.Label):
+            return False  # The last build hit a trait error, so try building again
+
+        self._syncing_widgets = True
+        try:
+            with inp_widget.hold_sync(), batch_button.hold_sync():
+                label.value = inp.label_str if inp.label_str != "" else inp.type_
+                if not batched:
+                    if isinstance(inp_widget, widgets.Dropdown):
+                        inp_widget.options = inp.dtype.items
+                    if isinstance(inp_widget, widgets.Text):
+                        inp_widget.value = str(inp.val)
+                    else:
+                        self._set_trait(inp_widget, "value", inp.val)
+                    inp_widget.disabled = (
+                        disabled or dtype_name not in _WIDGET_FACTORIES
+                    )
+                batch_button.disabled = inp.dtype is None or not isinstance(
+                    inp.node, BatchingNode
+                )
+                batch_button.value = (
+                    inp.dtype.batched if inp.dtype is not None else False
+                )
+                reset_button.disabled = has_connections
+        except TraitError:
+            return False
+        finally:
+            self._syncing_widgets = False
+        return True
+
+    def _close_widget(self, widget: widgets.Widget) -> None:
+        """
+        Close a widget we're discarding (and any children it has) right away, rather
+        than leaving it open on the frontend until the next `clear`.
+        """
+        for child in getattr(widget, "children", ()):
+            self._close_widget(child)
+        self._disconnect(widget)
+        for w in (
+            widget,
+            getattr(widget, "layout", None),
+            getattr(widget, "style", None),
+        ):
+            # Layouts and styles only get closed if we made them, as they may be shared
+            if w is not None and (w is widget or w in self._drawn_widgets):
+                w.close()
+                try:
+                    self._drawn_widgets.remove(w)
+                except ValueError:
+                    pass
+
+    def _on_any_change(self, change: dict | widgets.Button, kind: str) -> None:
+        """
+        Route a change from any row widget to its handler, looking up which input it
+        belongs to from the widget (buttons pass themselves instead of a change dict).
+        """
+        if self._syncing_widgets:
+            return
+        owner = change if isinstance(change, widgets.Button) else change["owner"]
+        i_c = owner._ironflow_row
+        if kind == "input":
+            self._input_change(i_c, change)
+        elif kind == "batch":
+            self._toggle_batching(i_c, change)
+        elif kind == "reset":
+            self._input_reset(i_c)
+
+    def _input_change(self, i_c: int, change: dict) -> None:
+        # Todo: Test this in exec mode
+        # The update stays on the kernel thread, since it draws node widgets to the
+        # canvas, but the (much more expensive) flow canvas redraw is debounced
+        self.node.inputs[i_c].update(change["new"])
+        # self.node.update(i_c)
+        self._redraw_flow_canvas()
+
+    @_debounce(wait_ms=100)
+    def _redraw_flow_canvas(self) -> None:
+        self.screen.redraw_active_flow_canvas()
+
+    def _toggle_batching(self, i_c: int, change: dict) -> None:
+        try:
+            InfoMsgs.write(
+                f"Batching for {self.node.title}.{self.node.inputs[i_c].label_str} "
+                f"set to {change['new']}"
+            )
+            if change["new"]:
+                self.node.inputs[i_c].batch()
+            else:
+                self.node.inputs[i_c].unbatch()
             self.screen.redraw_active_flow_canvas()
-
-        return input_reset
+            self.draw()
+        except AttributeError:
+            pass
+
+    def _input_reset(self, i_c: int) -> None:
+        default = self.node.inputs[i_c].dtype.default
+        self.node.inputs[i_c].update(default)
+        InfoMsgs.write(
+            f"Value for {self.node.title}.{self.node.inputs[i_c].label_str} "
+            f"reset to {default}"
+        )
+        _, (_, associated_input_field, _, _) = self._row_cache[(id(self.node), i_c)]
+        try:
+            associated_input_field.value = default
+        except TraitError:
+            self.screen.update_node_control()
+        finally:
+            pass
+        self.node.update(i_c)
+        self.screen.redraw_active_flow_canvas()
 
     def _draw_input_box(self) -> widgets.GridBox | widgets.Output:
         input_fields = self._input_field_list()
         n_fields = len(input_fields)
         if n_fields > 0:
-            return widgets.GridBox(
-                list(np.array(input_fields).flatten()),
-                layout=widgets.Layout(
-                    grid_template_columns="auto auto auto auto",
-                    grid_auto_rows=f"{self._row_height}px",
-                    border="solid 1px blue",
-                    height=f"{self._box_height(n_fields)}px",
-                    # Automatic height like this really should be doable just with the CSS,
-                    # but for the life of me I can't get a CSS solution working right -Liam
-                ),
-            )
-        else:
-            return widgets.Output()
+            children = list(chain.from_iterable(input_fields))
+            if not isinstance(self._input_box, widgets.GridBox):
+                if self._input_box is not None:
+                    self._close_widget(self._input_box)
+                self._input_box = widgets.GridBox(
+                    children,
+                    layout=widgets.Layout(
+                        grid_template_columns="auto auto auto auto",
+                        grid_template_rows=self._grid_rows(n_fields),
+                        border=self._input_border,
+                        # Only a floor, so the flex parent doesn't squash the grid; the
+                        # browser takes care of the rest and the parent scrolls
+                        min_height=f"{self._box_height(n_fields)}px",
+                    ),
+                )
+            elif list(self._input_box.children) != children:
+                with self._input_box.hold_sync(), self._input_box.layout.hold_sync():
+                    self._input_box.children = children
+                    self._input_box.layout.grid_template_rows = self._grid_rows(
+                        n_fields
+                    )
+                    self._input_box.layout.min_height = (
+                        f"{self._box_height(n_fields)}px"
+                    )
+        elif not isinstance(self._input_box, widgets.Output):
+            if self._input_box is not None:
+                self._input_box.children = []  # Rows were released for recycling
+                self._close_widget(self._input_box)
+            self._input_box = widgets.Output()
+        return self._input_box
 
     def _box_height(self, n_rows: int) -> int:
         return n_rows * self._row_height + 8
 
+    def _grid_rows(self, n_rows: int) -> str:
+        return f"repeat({n_rows}, {self._row_height}px)"
+
     def _draw_info_box(self) -> widgets.VBox:
         glob_id_val = None
-        if hasattr(self.node, "GLOBAL_ID"):
+        if _node_caps(type(self.node))[1]:
             glob_id_val = self.node.GLOBAL_ID
+
+        if self._info_box is not None:
+            title, global_id = self._info_box.children
+            with title.hold_sync(), global_id.hold_sync():
+                title.value = str(self.node.title)
+                global_id.value = str(glob_id_val)
+            return self._info_box
+
         global_id = widgets.Text(
             value=str(glob_id_val),
             description="GLOBAL_ID:",
             disabled=True,
-            layout=widgets.Layout(height=f"{self._row_height}px"),
+            layout=self._row_layout,
         )
 
         title = widgets.Text(
             value=str(self.node.title),
             description="Title:",
             disabled=True,
-            layout=widgets.Layout(height=f"{self._row_height}px"),
+            layout=self._row_layout,
         )
 
-        info_box = widgets.VBox(
+        self._info_box = widgets.VBox(
             [title, global_id],
             layout=widgets.Layout(
                 height=f"{self._box_height(2)}px",
-                border="solid 1px red",
+                border=self._info_border,
             ),
         )
-        return info_box
+        return self._info_box
 
     def clear(self) -> None:
         self.node = None
+        for _, row in self._row_cache.values():
+            self._release_row(row)
+        self._row_cache = {}
+        self._window_start = 0
+        self._drawn_signature = None
+        self._input_box = None
+        self._info_box = None
+        self._input_widget_cache = {}
         self.widget.children = []
         self.widget.layout.border = ""
         super().clear()
+
+    def close(self) -> None:
+        self.clear()  # Releases any rows into the pool
+        for pool in self._widget_pool.values():
+            for widget in pool:
+                self._disconnect(widget)
+                self._drawn_widgets += self._widget_parts(widget)
+        self._widget_pool = {}
+        super().close()
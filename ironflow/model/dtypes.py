@@ -12,8 +12,8 @@ Further, the dtypes are broken down into broad categories of `Data`, `List`, and
 `Choice` with different behaviours under regular and batched conditions.
 
 Warning:
-    Any additional types defined here later need to be added to the list in
-    `DType.from_str` to work with (de)serialization.
+    Any additional types defined here later need to be added to `_DTYPE_BY_STR` (at
+    the bottom of the module) to work with (de)serialization.
 
 Implementation of Dtypes changes in ryvencore v0.4, so this file may be short-lived.
 """
@@ -21,7 +21,8 @@ Implementation of Dtypes changes in ryvencore v0.4, so this file may be short-li
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from copy import deepcopy
+from typing import Any, ClassVar, Optional
 
 import numpy as np
 from ryvencore.dtypes import DType as DTypeCore
@@ -35,15 +36,67 @@ def isiterable(obj):
         return False
 
 
+_MISSING = object()
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, type)
+_EXACTLY_IMMUTABLE = frozenset(_IMMUTABLE_TYPES)
+_SUBSET_CACHE: dict[tuple[tuple, tuple], bool] = {}
+_VC_INTERN: dict[tuple, tuple] = {}
+_DTYPE_TYPES: set[type] = set()
+
+
+def _as_class_tuple(classes) -> tuple:
+    """
+    Valid classes as an interned tuple, so that dtypes with the same classes share one.
+    """
+    if classes is None:
+        as_tuple: tuple = ()
+    elif isinstance(classes, type):
+        as_tuple = (classes,)
+    else:
+        as_tuple = tuple(classes)
+    return _VC_INTERN.setdefault(as_tuple, as_tuple)
+
+
 def other_classes_are_subset(other, reference):
-    return all(any(issubclass(o, ref) for ref in reference) for o in other)
+    # Memoized on the classes themselves (rather than on container ids), so answers
+    # can't go stale when someone mutates a `valid_classes` list in place
+    key = (tuple(other), tuple(reference))
+    is_subset = _SUBSET_CACHE.get(key, _MISSING)
+    if is_subset is _MISSING:
+        is_subset = all(any(issubclass(o, ref) for ref in reference) for o in other)
+        _SUBSET_CACHE[key] = is_subset
+    return is_subset
+
+
+def is_plain(value) -> bool:
+    """
+    Whether a value is immutable or a flat list or tuple of immutable values, which is
+    what dtype states mostly hold and which is cheap to copy.
+    """
+    return isinstance(value, _IMMUTABLE_TYPES) or (
+        (type(value) is list or type(value) is tuple)
+        and all(isinstance(v, _IMMUTABLE_TYPES) for v in value)
+    )
+
+
+def cheap_copy(value):
+    """A `deepcopy`, but short-circuited for plain values."""
+    if not is_plain(value):
+        return deepcopy(value)
+    elif type(value) is list:
+        return list(value)
+    else:
+        return value
 
 
 class DType(DTypeCore, ABC):
+    _str: ClassVar[str] = "DType"
+    _extra_data: ClassVar[tuple[str, ...]] = ()  # Subclass attributes to serialize
+
     def __init__(
         self,
         default,
-        bounds: tuple = None,
+        bounds: Optional[tuple] = None,
         doc: str = "",
         _load_state=None,
         valid_classes=None,
@@ -57,41 +110,55 @@ class DType(DTypeCore, ABC):
             _load_state=_load_state,
         )
         if _load_state is None:
-            if isinstance(valid_classes, list):
-                self.valid_classes = list(valid_classes)
-            elif valid_classes is not None:
-                self.valid_classes = [valid_classes]
-            else:
-                self.valid_classes = []
+            self.valid_classes = valid_classes
             self.allow_none = allow_none
             self.batched = batched
-        self.add_data("valid_classes")
-        self.add_data("allow_none")
-        self.add_data("batched")
+        self.add_data("valid_classes", "allow_none", "batched", *self._extra_data)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._str = "DType." + cls.__name__
+        _DTYPE_TYPES.add(cls)
+
+    def __str__(self):
+        return self._str
+
+    @property
+    def valid_classes(self) -> tuple:
+        return self._valid_classes
+
+    @valid_classes.setter
+    def valid_classes(self, classes):
+        # Normalizes lists (e.g. from older saved states) and single classes alike
+        self._valid_classes = _as_class_tuple(classes)
 
     @staticmethod
     def from_str(s):
         # Load local dtypes, not ryven dtypes
-        for DTypeClass in [
-            Boolean,
-            Choice,
-            Data,
-            Float,
-            Integer,
-            List,
-            String,
-            Untyped,
-        ]:
-            if s == "DType." + DTypeClass.__name__:
-                return DTypeClass
-
-        return None
+        return _DTYPE_BY_STR.get(s)
+
+    def clone(self) -> DType:
+        """
+        A copy sharing no mutable state with this dtype, which is much cheaper than a
+        `deepcopy` for the usual case of immutable attributes.
+        """
+        new = self.__class__.__new__(self.__class__)
+        state = self.__dict__.copy()
+        for name, value in state.items():
+            # Exact type lookup first, which is all most attributes need
+            if type(value) not in _EXACTLY_IMMUTABLE:
+                state[name] = cheap_copy(value)
+        new.__dict__ = state
+        return new
 
     def _classes_are_subset(self, other_classes):
         return other_classes_are_subset(other_classes, self.valid_classes)
 
     def accepts(self, other: DType | Any | None):
-        if isinstance(other, DType):
+        # Look the type up directly, since the (ABC) instance check is comparatively slow
+        if other is None:
+            return self._accepts_instance(None)
+        elif type(other) in _DTYPE_TYPES:
             return self._accepts_dtype(other)
         else:
             return self._accepts_instance(other)
@@ -139,6 +206,33 @@ class Untyped(DType):
     Untyped is always valid unless the value is None and None is not allowed.
     """
 
+    # Default state at the class level, for `blank` instances to fall back on
+    default = None
+    val = None
+    doc = ""
+    bounds = None
+    _valid_classes: tuple = ()
+    allow_none = True
+    batched = False
+    _data: Any = (
+        "default",
+        "val",
+        "doc",
+        "bounds",
+        "valid_classes",
+        "allow_none",
+        "batched",
+    )
+
+    @classmethod
+    def blank(cls) -> Untyped:
+        """
+        A default instance that skips the init entirely. Until an attribute is written
+        to (e.g. `batched` when batching a port), it just reads the shared defaults from
+        the class, i.e. it is copy-on-write.
+        """
+        return cls.__new__(cls)
+
     def __init__(
         self,
         doc: str = "",
@@ -190,6 +284,8 @@ class Data(DType):
     None is allowed.
     """
 
+    _extra_data: ClassVar[tuple[str, ...]] = ("size",)
+
     def __init__(
         self,
         default=None,
@@ -212,7 +308,6 @@ class Data(DType):
             allow_none=allow_none,
             batched=batched,
         )
-        self.add_data("size")
 
     def _accepts_dtype(self, other: DType):
         if isinstance(other, Untyped):
@@ -232,17 +327,33 @@ class Data(DType):
         else:
             return False
 
+    def _accepts_instance(self, val: Any):
+        # The unbatched case of the parent method with everything inlined, since this
+        # is the check hit most by far
+        if self.batched:
+            return self._batch_accepts_instance(val)
+        else:
+            return (val is None and self.allow_none) or isinstance(
+                val, self._valid_classes
+            )
+
     def _accepts_non_none_instance(self, val: Any):
-        return any(isinstance(val, c) for c in self.valid_classes)
+        return isinstance(val, self._valid_classes)
 
     def _batch_accepts_instance(self, val: Any):
-        if hasattr(val, "__iter__"):
-            if any(v is None for v in val) and not self.allow_none:
-                return False
-            else:
-                return self._classes_are_subset(
-                    set([type(v) for v in val if v is not None])
-                )
+        if isinstance(val, np.ndarray) and val.ndim == 1 and val.dtype != object:
+            # Every element gets boxed as the same scalar type, so check that just once
+            return val.size == 0 or issubclass(val.dtype.type, self._valid_classes)
+        elif hasattr(val, "__iter__"):
+            valid_classes = self._valid_classes
+            for v in val:
+                # Bail out on the first bad element instead of collecting all the types
+                if v is None:
+                    if not self.allow_none:
+                        return False
+                elif not isinstance(v, valid_classes):
+                    return False
+            return True
         else:
             return False
 
@@ -250,8 +361,8 @@ class Data(DType):
 class Integer(Data):
     def __init__(
         self,
-        default: int = 0,
-        bounds: tuple = None,
+        default: Optional[int] = 0,
+        bounds: Optional[tuple] = None,
         doc: str = "",
         _load_state=None,
         valid_classes=None,
@@ -267,14 +378,15 @@ class Integer(Data):
             allow_none=allow_none,
             batched=batched,
         )
-        self.add_data("bounds")
 
 
 class Float(Data):
+    _extra_data: ClassVar[tuple[str, ...]] = Data._extra_data + ("decimals",)
+
     def __init__(
         self,
-        default: float = 0.0,
-        bounds: tuple = None,
+        default: Optional[float] = 0.0,
+        bounds: Optional[tuple] = None,
         decimals: int = 10,
         doc: str = "",
         _load_state=None,
@@ -294,8 +406,6 @@ class Float(Data):
             allow_none=allow_none,
             batched=batched,
         )
-        self.add_data("bounds")
-        self.add_data("decimals")
 
 
 class Boolean(Data):
@@ -321,7 +431,7 @@ class Boolean(Data):
 class String(Data):
     def __init__(
         self,
-        default: str = "",
+        default: Optional[str] = "",
         doc: str = "",
         _load_state=None,
         valid_classes=None,
@@ -362,6 +472,8 @@ class Choice(DType):
     not match the input items list).
     """
 
+    _extra_data: ClassVar[tuple[str, ...]] = ("items",)
+
     def __init__(
         self,
         default=None,
@@ -381,7 +493,6 @@ class Choice(DType):
             allow_none=allow_none,
             batched=batched,
         )
-        self.add_data("items")
 
     def _accepts_dtype(self, other: DType):
         # TODO: Temporary code duplication while splitting Data and Choice
@@ -474,11 +585,25 @@ class List(DType):
             return False
 
     def _accepts_non_none_instance(self, val: Any):
-        return isiterable(val) and all(
-            any(isinstance(v, c) for c in self.valid_classes) for v in val
-        )
+        if not isiterable(val):
+            return False
+        valid_classes = self._valid_classes
+        return all(isinstance(v, valid_classes) for v in val)
 
     def _batch_accepts_instance(self, val: Any):
         return isiterable(val) and all(
             self._accepts_none(v) or self._accepts_non_none_instance(v) for v in val
         )
+
+
+_DTYPE_CLASSES: list[type[DType]] = [
+    Boolean,
+    Choice,
+    Data,
+    Float,
+    Integer,
+    List,
+    String,
+    Untyped,
+]
+_DTYPE_BY_STR = {DTypeClass._str: DTypeClass for DTypeClass in _DTYPE_CLASSES}
@@ -9,7 +9,6 @@ from typing import Callable, Optional
 
 import numpy as np
 from owlready2 import Thing
-from pyiron_atomistics import Project
 from pyiron_base import GenericJob
 from ryvencore import Node as NodeCore
 from ryvencore.Base import Event
@@ -266,7 +265,7 @@ class Node(NodeCore):
 
     @property
     def all_input_is_valid(self):
-        return all(p.ready for p in self.inputs.ports)
+        return all(p.check_ready() for p in self.inputs.ports)
 
     def place_event(self):
         # place_event() is executed *before* the connections are built
@@ -629,9 +628,17 @@ class JobMaker(JobNode, ABC):
     """
 
     init_inputs = JobNode.init_inputs + [
-        NodeInputBP(dtype=dtypes.Data(valid_classes=Project), label="project")
+        NodeInputBP(dtype=dtypes.Data(valid_classes=object), label="project")
     ]
 
+    def place_event(self):
+        super().place_event()
+        # pyiron_atomistics is slow to import, so don't pay for it until a job maker
+        # actually gets made
+        from pyiron_atomistics import Project
+
+        self.inputs.ports.project.dtype.valid_classes = Project
+
 
 class JobTaker(JobNode, ABC):
     """
@@ -7,10 +7,9 @@ A new output port class that has a dtype.
 
 from __future__ import annotations
 
-from copy import deepcopy
+from operator import is_
 from typing import Optional, TYPE_CHECKING
 
-from numpy import argwhere
 from ryvencore.InfoMsgs import InfoMsgs
 from ryvencore.NodePort import NodeInput as NodeInputCore, NodeOutput as NodeOutputCore
 from ryvencore.NodePortBP import (
@@ -19,14 +18,35 @@ from ryvencore.NodePortBP import (
 )
 from ryvencore.utils import serialize
 
-from ironflow.model.dtypes import DType, Untyped
+from ironflow.model.dtypes import DType, Untyped, cheap_copy, is_plain
 
 if TYPE_CHECKING:
     from ironflow.model.node import Node
 
 
+def _snapshot_state(state: dict) -> Optional[dict]:
+    """
+    A copy of a (dtype) state to compare later states against, or None if it holds
+    things that could change without us noticing.
+    """
+    if all(is_plain(value) for value in state.values()):
+        return {name: cheap_copy(value) for name, value in state.items()}
+    return None
+
+
+def _holds_same_objects(old, new) -> bool:
+    """
+    Whether a (plain) value, or the elements of a list value, are the very same objects
+    as in a snapshot of it. This is stricter than equality, which e.g. doesn't tell
+    `[1, 2]` from `[1.0, 2.0]` even though the two serialize differently.
+    """
+    if type(old) is list:
+        return type(new) is list and len(old) == len(new) and all(map(is_, old, new))
+    return old is new
+
+
 class HasDType:
-    """A mixin to add the valid value check property"""
+    """A mixin to add the valid value check method (and property)"""
 
     def set_dtype_ok(self):
         if self.dtype is not None:
@@ -37,18 +57,25 @@ class HasDType:
         else:
             self._dtype_ok = True
 
-    @property
-    def dtype_ok(self):
+    def check_dtype(self):
         try:
             return self._dtype_ok
         except AttributeError:
             self.set_dtype_ok()
             return self._dtype_ok
 
+    dtype_ok = property(check_dtype)
+
 
 class HasOType:
     """A mixin to add the valid value check to properties with an ontology type"""
 
+    _connection_epoch = 0  # Ticks whenever any port gets (dis)connected
+
+    @staticmethod
+    def _connections_changed():
+        HasOType._connection_epoch += 1
+
     def recalculate_otype_checks(self, ignore=None):
         self.set_otype_ok()
         if self.otype is not None:
@@ -73,83 +100,122 @@ class HasOType:
                         port.recalculate_otype_checks(ignore=self)
 
     def set_otype_ok(self):
-        if self.otype is not None:
-            if isinstance(self, NodeInput):
-                input_tree = self.otype.get_source_tree(
-                    additional_requirements=self.get_downstream_requirements()
-                )
-                self._otype_ok = all(
-                    con.out.all_connections_found_in(input_tree)
-                    for con in self.connections
-                    if con.out.otype is not None
-                )
-            else:
-                self._otype_ok = all(
-                    con.inp.workflow_tree_contains_connections_of(self)
-                    for con in self.connections
-                    if con.inp.otype is not None
-                )
+        self._otype_ok = self._check_otype()
+
+    def _check_otype(self):
+        if self.otype is None:
+            return True
+        elif isinstance(self, NodeInput):
+            outputs = [con.out for con in self.connections if con.out.otype is not None]
+            if len(outputs) == 0:
+                return True  # Don't bother building the tree
+            input_tree = self.otype.get_source_tree(
+                additional_requirements=self.get_downstream_requirements()
+            )
+            for out in outputs:
+                if not out.all_connections_found_in(input_tree):
+                    return False
+            return True
         else:
-            self._otype_ok = True
+            for con in self.connections:
+                if (
+                    con.inp.otype is not None
+                    and not con.inp.workflow_tree_contains_connections_of(self)
+                ):
+                    return False
+            return True
 
-    @property
-    def otype_ok(self):
+    def check_otype(self):
         try:
             return self._otype_ok
         except AttributeError:
             self.set_otype_ok()
             return self._otype_ok
 
+    otype_ok = property(check_otype)
+
+    @staticmethod
+    def _index_of_source(otype, sources) -> Optional[int]:
+        return next(
+            (i for i, source in enumerate(sources) if otype == source.value), None
+        )
+
     def _output_graph_is_represented_in_workflow_tree(self, output_port, input_tree):
-        try:
-            output_index = argwhere(
-                [output_port.otype == source.value for source in input_tree.children]
-            )[0][0]
-            upstream_inputs = [
-                inp
-                for inp in output_port.node.inputs
-                if inp.otype is not None and len(inp.connections) > 0
-            ]
-            for usi in upstream_inputs:
-                input_branches = input_tree.children[output_index].children[0].children
+        # Walk the upstream graph with a stack of (output port, tree) pairs still to
+        # check, rather than recursing
+        to_check = [(output_port, input_tree)]
+        while to_check:
+            output_port, input_tree = to_check.pop()
+            output_index = self._index_of_source(output_port.otype, input_tree.children)
+            if output_index is None:
+                return False
+            output_branches = input_tree.children[output_index].children
+            for usi in output_port.node.inputs:
+                if usi.otype is None or len(usi.connections) == 0:
+                    continue
+                if len(output_branches) == 0:
+                    return False
+                input_branches = output_branches[0].children
                 # input/generic->outputs->function->inputs
 
-                input_index = argwhere(
-                    [usi.otype == source.value for source in input_branches]
-                )[0][0]
+                input_index = self._index_of_source(usi.otype, input_branches)
+                if input_index is None:
+                    return False
 
                 for con in usi.connections:
-                    if (
-                        con.out.otype is not None
-                        and not self._output_graph_is_represented_in_workflow_tree(
-                            con.out, input_branches[input_index]
-                        )
-                    ):
-                        return False
-            return True
-        except IndexError:
-            # Can't slice argwhere if it finds nothing
-            return False
+                    if con.out.otype is not None:
+                        to_check.append((con.out, input_branches[input_index]))
+        return True
 
     def get_downstream_requirements(self):
-        downstream_requirements = []
+        """
+        The requirements of this port and everything downstream of it.
+
+        Walking the downstream graph is expensive, so results are cached until the next
+        time any connection changes.
+        """
+        epoch, requirements = getattr(self, "_downstream_requirements", (None, None))
+        if epoch != HasOType._connection_epoch:
+            requirements = self._find_downstream_requirements()
+            self._downstream_requirements = (HasOType._connection_epoch, requirements)
+        return list(requirements)
+
+    def _find_downstream_requirements(self):
+        downstream_requirements = set()
         for out in self.node.outputs:
             if out.otype is not None:
-                for downstream_inp in [conn.inp for conn in out.connections]:
-                    if downstream_inp.otype is not None:
-                        downstream_requirements += (
-                            downstream_inp.get_downstream_requirements()
+                for conn in out.connections:
+                    if conn.inp.otype is not None:
+                        downstream_requirements.update(
+                            conn.inp.get_downstream_requirements()
                         )
+        downstream_requirements = list(downstream_requirements)
         try:
-            return self.otype.get_requirements(list(set(downstream_requirements)))
+            return self.otype.get_requirements(downstream_requirements)
         except AttributeError:
-            return list(set(downstream_requirements))
+            return downstream_requirements
 
 
 class HasTypes(HasOType, HasDType):
-    @property
-    def ready(self):
-        return self.dtype_ok and self.otype_ok
+    _ready_dirty = True
+
+    def set_dtype_ok(self):
+        super().set_dtype_ok()
+        self._ready_dirty = True
+
+    def set_otype_ok(self):
+        super().set_otype_ok()
+        self._ready_dirty = True
+
+    def check_ready(self):
+        # The type checks only get re-run when the value, dtype or connections change,
+        # so there's only something to recombine after one of them did
+        if self._ready_dirty:
+            self._ready = self.check_dtype() and self.check_otype()
+            self._ready_dirty = False
+        return self._ready
+
+    ready = property(check_ready)
 
 
 class NodeInput(NodeInputCore, HasTypes):
@@ -167,7 +233,7 @@ class NodeInput(NodeInputCore, HasTypes):
             type_=type_,
             label_str=label_str,
             add_data=add_data if add_data is not None else {},
-            dtype=Untyped() if dtype is None else deepcopy(dtype),
+            dtype=Untyped.blank() if dtype is None else dtype.clone(),
         )
         self.otype = otype
 
@@ -219,6 +285,7 @@ class NodeInput(NodeInputCore, HasTypes):
 
     def connected(self):
         super().connected()
+        self._connections_changed()
         self.set_dtype_ok()
         self.recalculate_otype_checks()  # Note: Only need to call or one of input or
         # output since Flow.add_connection calls .connected on both inp and out
@@ -228,6 +295,7 @@ class NodeInput(NodeInputCore, HasTypes):
 
     def disconnected(self):
         super().disconnected()
+        self._connections_changed()
         self.recalculate_otype_checks()
 
 
@@ -241,15 +309,16 @@ class NodeOutput(NodeOutputCore, HasTypes):
         otype=None,
     ):
         super().__init__(node=node, type_=type_, label_str=label_str)
-        self.dtype = Untyped() if dtype is None else deepcopy(dtype)
+        self.dtype = Untyped.blank() if dtype is None else dtype.clone()
         self.otype = otype
+        self._serialized_dtype_cache: tuple[Optional[dict], str] = (None, "")
 
     def data(self) -> dict:
         data = super().data()
 
         if self.dtype is not None:
             data["dtype"] = str(self.dtype)
-            data["dtype state"] = serialize(self.dtype.get_state())
+            data["dtype state"] = self._serialize_dtype_state()
 
         if self.otype is not None:
             data["otype_namespace"] = self.otype.namespace.name
@@ -257,6 +326,19 @@ class NodeOutput(NodeOutputCore, HasTypes):
 
         return data
 
+    def _serialize_dtype_state(self) -> str:
+        # Dtype states rarely change between saves, so re-use the last serialization
+        state = self.dtype.get_state()
+        snapshot, serialized = self._serialized_dtype_cache
+        if (
+            snapshot is None
+            or list(snapshot) != list(state)
+            or not all(map(_holds_same_objects, snapshot.values(), state.values()))
+        ):
+            serialized = serialize(state)
+            self._serialized_dtype_cache = (_snapshot_state(state), serialized)
+        return serialized
+
     def all_connections_found_in(self, tree):
         """
         Checks to see if actual ontologically typed connections match with all
@@ -270,6 +352,7 @@ class NodeOutput(NodeOutputCore, HasTypes):
 
     def disconnected(self):
         super().disconnected()
+        self._connections_changed()
         self.recalculate_otype_checks()
         # Unlike `connected`, we do need to explicitly recalculate on the disconnected
         # output, because it is no longer part of the input's graph tree!
@@ -280,7 +363,7 @@ class NodeInputBP(NodeInputBPCore):
         self,
         label: str = "",
         type_: str = "data",
-        dtype: DType = None,
+        dtype: Optional[DType] = None,
         add_data={},
         otype=None,
     ):
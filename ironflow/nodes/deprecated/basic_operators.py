@@ -79,7 +79,7 @@ class NOT_Node(LogicNodeBase):
     title = "not"
 
     def apply_op(self, elements: list):
-        return all([not bool(e) for e in elements])
+        return all(not bool(e) for e in elements)
 
 
 class AND_Node(LogicNodeBase):
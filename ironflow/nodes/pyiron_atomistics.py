@@ -930,7 +930,7 @@ class Lammps_Node(Engine):
     def update_event(self, inp=-1):
         if inp == 1:
             self.inputs.ports.structure.set_dtype_ok()
-            if self.inputs.ports.structure.ready:
+            if self.inputs.ports.structure.check_ready():
                 self._update_potential_choices()
         super().update_event(inp=inp)
 
@@ -0,0 +1,195 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+import ipywidgets as widgets
+
+from ironflow.gui.gui import GUI
+from ironflow.node_tools import DataNode, Node, NodeInputBP, dtypes
+
+
+class NoneNode(Node):
+    title = "NoneNode"
+    init_inputs = [
+        NodeInputBP(dtype=dtypes.Float(default=None, allow_none=True), label="x"),
+        NodeInputBP(dtype=dtypes.Integer(default=None, allow_none=True), label="n"),
+        NodeInputBP(dtype=dtypes.Boolean(default=None, allow_none=True), label="b"),
+    ]
+
+    def update_event(self, inp=-1):
+        pass
+
+
+class DataInputNode(DataNode):
+    title = "DataInputNode"
+    init_inputs = [
+        NodeInputBP(dtype=dtypes.Data(valid_classes=object), label="data"),
+    ]
+
+    def node_function(self, data, **kwargs) -> dict:
+        return {}
+
+
+class TestNodeController(TestCase):
+    def setUp(self):
+        self.gui = GUI("gui", log_to_display=False)
+        canvas = self.gui.workflows.flow_canvas
+        canvas.add_node(0, 0, self.gui.nodes_dictionary["array"]["Linspace"])
+        canvas.add_node(1, 0, self.gui.nodes_dictionary["array"]["Linspace"])
+        self.n1, self.n2 = canvas.flow.nodes
+        self.controller = self.gui.workflows.node_controller
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            os.remove(os.path.join(".", "pyiron.log"))
+        except (FileNotFoundError, PermissionError):
+            pass
+
+    @staticmethod
+    def n_widgets():
+        return len(widgets.Widget.widgets)
+
+    def rows(self):
+        """(label, input, batch button, reset button) for each row currently shown."""
+        children = self.controller._input_box.children
+        return [tuple(children[i : i + 4]) for i in range(0, len(children), 4)]
+
+    def test_node_switching(self):
+        self.n1.inputs[0].update(3.0)
+        self.controller.draw_for_node(self.n1)
+        n_widgets = self.n_widgets()
+        self.controller.draw_for_node(self.n2)
+        self.assertListEqual(
+            [("min", 1.0), ("max", 2.0), ("steps", 10)],
+            [(label.value, inp.value) for label, inp, _, _ in self.rows()],
+            msg="Recycled widgets should show the newly drawn node",
+        )
+
+        self.rows()[0][1].value = 5.0
+        self.assertEqual(5.0, self.n2.inputs[0].val)
+        self.assertEqual(
+            3.0, self.n1.inputs[0].val, msg="Only the drawn node should get changed"
+        )
+
+        for node in [self.n1, self.n2, self.n1, self.n2]:
+            self.controller.draw_for_node(node)
+        self.assertEqual(
+            n_widgets,
+            self.n_widgets(),
+            msg="Switching between nodes should recycle widgets, not make new ones",
+        )
+
+    def test_paging(self):
+        self.controller._max_visible_rows = 2
+        self.controller.draw_for_node(self.n1)
+        self.assertIn(self.controller._pager, self.controller.widget.children)
+        self.assertListEqual(["min", "max"], [row[0].value for row in self.rows()])
+
+        self.controller._rows_down.click()
+        self.assertListEqual(
+            ["max", "steps"],
+            [row[0].value for row in self.rows()],
+            msg="The last page should still be full",
+        )
+        self.rows()[1][1].value = 7
+        self.assertEqual(
+            7, self.n1.inputs[2].val, msg="Paged rows should change their own input"
+        )
+
+        self.controller._rows_up.click()
+        self.assertListEqual(["min", "max"], [row[0].value for row in self.rows()])
+        n_widgets = self.n_widgets()  # Now that both pages have been drawn
+        for button in [self.controller._rows_up, self.controller._rows_down] * 2:
+            button.click()
+        self.assertEqual(
+            n_widgets,
+            self.n_widgets(),
+            msg="Paging should recycle widgets, not make new ones",
+        )
+
+    def test_redraws(self):
+        self.controller.draw_for_node(self.n1)
+        n_widgets = self.n_widgets()
+        for _ in range(3):
+            self.controller.draw()
+        self.assertEqual(n_widgets, self.n_widgets())
+
+    def test_batching(self):
+        self.controller.draw_for_node(self.n1)
+        self.rows()[0][2].value = True
+        self.assertTrue(self.n1.inputs[0].dtype.batched)
+        self.assertEqual("Batched Float", self.rows()[0][1].value)
+
+        self.rows()[0][2].value = False
+        self.assertFalse(self.n1.inputs[0].dtype.batched)
+        self.assertIsInstance(self.rows()[0][1], widgets.FloatText)
+
+        canvas = self.gui.workflows.flow_canvas
+        canvas.add_node(2, 0, self.gui.nodes_dictionary["array"]["Select"])
+        self.controller.draw_for_node(canvas.flow.nodes[-1])
+        self.rows()[0][2].value = True
+        self.assertEqual(
+            "Batched List",
+            self.rows()[0][1].value,
+            msg="Dtypes without their own widget should still be shown by name",
+        )
+
+        self.gui.register_node(DataInputNode, node_group="user")
+        canvas.add_node(3, 0, self.gui.nodes_dictionary["user"]["DataInputNode"])
+        self.controller.draw_for_node(canvas.flow.nodes[-1])
+        self.rows()[0][2].value = True
+        self.assertEqual("Batched Data", self.rows()[0][1].value)
+
+    def test_none_values(self):
+        self.gui.register_node(NoneNode, node_group="user")
+        canvas = self.gui.workflows.flow_canvas
+        canvas.add_node(2, 0, self.gui.nodes_dictionary["user"]["NoneNode"])
+        none_node = canvas.flow.nodes[-1]
+
+        def check_rows():
+            self.assertListEqual(
+                [
+                    (widgets.FloatText, 0.0),
+                    (widgets.IntText, 0),
+                    (widgets.Checkbox, False),
+                ],
+                [(type(inp), inp.value) for _, inp, _, _ in self.rows()],
+                msg="Inputs without a value should fall back to the widget default, "
+                "like they do when the widget is first made",
+            )
+
+        self.controller.draw_for_node(none_node)
+        check_rows()
+        self.controller.update()
+        check_rows()
+
+        self.controller.draw_for_node(self.n1)
+        self.controller.draw_for_node(none_node)
+        check_rows()
+        self.assertIsNone(none_node.inputs[0].val)
+
+    def test_reset(self):
+        self.controller.draw_for_node(self.n1)
+        self.rows()[1][1].value = 5.0
+        self.assertEqual(5.0, self.n1.inputs[1].val)
+
+        self.rows()[1][3].click()
+        self.assertEqual(2.0, self.n1.inputs[1].val)
+        self.assertEqual(2.0, self.rows()[1][1].value)
+
+    def test_draw_for_same_node(self):
+        with patch.object(self.controller, "draw", wraps=self.controller.draw) as draw:
+            self.controller.draw_for_node(self.n1)
+            self.controller.draw_for_node(self.n1)
+            self.assertEqual(
+                1, draw.call_count, msg="Nothing changed, so there's nothing to draw"
+            )
+
+            self.n1.inputs[0].update(4.0)
+            self.controller.draw_for_node(self.n1)
+            self.assertEqual(2, draw.call_count, msg="The input value changed")
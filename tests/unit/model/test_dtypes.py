@@ -19,6 +19,20 @@ class TestIsiterable(TestCase):
         self.assertFalse(dtypes.isiterable(42))
 
 
+class TestOtherClassesAreSubset(TestCase):
+    def test_other_classes_are_subset(self):
+        self.assertTrue(dtypes.other_classes_are_subset([bool], [int, str]))
+        self.assertFalse(dtypes.other_classes_are_subset([int, str], [int]))
+
+        reference = [int]
+        self.assertFalse(dtypes.other_classes_are_subset([str], reference))
+        reference.append(str)
+        self.assertTrue(
+            dtypes.other_classes_are_subset([str], reference),
+            msg="Memoized answers should not go stale when the classes change"
+        )
+
+
 class TestDTypes(TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -48,6 +62,56 @@ class TestDTypes(TestCase):
         self.assertEqual(choice.valid_classes, reloaded.valid_classes)
         self.assertEqual(choice.batched, reloaded.batched)
 
+    def test_clone(self):
+        choice = dtypes.Choice(
+            default=["foo"], items=["bar", "foo"], valid_classes=[list], batched=True
+        )
+        clone = choice.clone()
+        self.assertIsInstance(clone, dtypes.Choice)
+        self.assertEqual(choice.get_state(), clone.get_state())
+
+        clone.items.append("baz")
+        clone.valid_classes += (tuple,)
+        clone.default.append("bar")
+        clone.batched = False
+        self.assertEqual(["bar", "foo"], choice.items, msg="Clones should be independent")
+        self.assertEqual((list,), choice.valid_classes)
+        self.assertEqual(["foo"], choice.default)
+        self.assertTrue(choice.batched)
+
+    def test_state(self):
+        self.assertListEqual(
+            [
+                "default",
+                "val",
+                "doc",
+                "bounds",
+                "valid_classes",
+                "allow_none",
+                "batched",
+                "size",
+                "decimals",
+            ],
+            list(dtypes.Float().get_state().keys()),
+            msg="Subclass data should be serialized once each, after the parent data",
+        )
+
+    def test_valid_classes(self):
+        self.assertEqual((), dtypes.Data().valid_classes)
+        self.assertEqual((int,), dtypes.Data(valid_classes=int).valid_classes)
+        self.assertEqual((int, str), dtypes.Data(valid_classes=[int, str]).valid_classes)
+
+        data = dtypes.Data(valid_classes=[int, str])
+        self.assertIs(
+            data.valid_classes,
+            dtypes.List(valid_classes=(int, str)).valid_classes,
+            msg="Equal valid classes should be shared between dtypes",
+        )
+        data.valid_classes = [float]
+        self.assertEqual(
+            (float,), data.valid_classes, msg="Assigned lists should become tuples"
+        )
+
     def test_untyped(self):
         untyped = dtypes.Untyped()
         with self.subTest("Test untyped input"):
@@ -59,6 +123,17 @@ class TestDTypes(TestCase):
             self.assertTrue(untyped.accepts([1, None, 3]))
             self.assertTrue(untyped.accepts("Strings are iterable"))
 
+        with self.subTest("Test blank untyped"):
+            blank = dtypes.Untyped.blank()
+            self.assertEqual(dtypes.Untyped().get_state()["batched"], blank.batched)
+            self.assertTrue(blank.accepts(None))
+            blank.batched = True
+            self.assertFalse(blank.accepts(7))
+            self.assertFalse(
+                dtypes.Untyped.blank().batched,
+                msg="Writes should only affect the instance written to"
+            )
+
         data = dtypes.Data(valid_classes=[int, str])
         with self.assertRaises(
                 ValueError,
@@ -78,6 +153,12 @@ class TestDTypes(TestCase):
         with self.subTest("Value checking"):
             self.assertTrue(d.accepts(7), msg="Value should match")
             self.assertFalse(d.accepts([]), msg="Value should not match")
+            self.assertFalse(d.accepts(None), msg="None is not allowed")
+            self.assertTrue(
+                dtypes.Data(valid_classes=object).accepts(None),
+                msg="None should still be accepted when it is a valid class instance",
+            )
+            self.assertTrue(dtypes.Data(valid_classes=type(None)).accepts(None))
 
         with self.subTest("Dtype checking"):
             self.assertTrue(
@@ -125,6 +206,16 @@ class TestDTypes(TestCase):
                 msg="Accepting strings is a feature, not a bug"
             )
 
+        with self.subTest("Test batched numpy arrays"):
+            self.assertFalse(
+                batched.accepts(np.arange(3)), msg="Numpy integers are not int"
+            )
+            self.assertTrue(dtypes.Integer(batched=True).accepts(np.arange(3)))
+            self.assertFalse(dtypes.Integer(batched=True).accepts(np.linspace(0, 1, 3)))
+            self.assertTrue(batched.accepts(np.array([], dtype=float)))
+            self.assertTrue(batched.accepts(np.array([1, "foo"], dtype=object)))
+            self.assertFalse(batched.accepts(np.array([1, 2.0], dtype=object)))
+
         with self.subTest("Test batched dtype checks"):
             self.assertFalse(
                 batched.accepts(dtypes.Data(valid_classes=batched.valid_classes)),
@@ -274,7 +365,7 @@ class TestDTypes(TestCase):
             self.assertTrue(list1.accepts([[1], None, [3.3]]))
 
             self.assertFalse(list1.accepts([[1], None, [3.3, None]]))
-            list1.valid_classes.append(type(None))
+            list1.valid_classes += (type(None),)
             self.assertTrue(list1.accepts([[1], None, [3.3, None]]))
 
     def test_cross_dtype_matching(self):
@@ -2,10 +2,13 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+from types import SimpleNamespace
 from unittest import TestCase
 
-from ironflow.model.dtypes import String
-from ironflow.model.port import NodeInput, NodeOutput, NodeOutputBP
+from ryvencore.utils import deserialize
+
+from ironflow.model.dtypes import Choice, String
+from ironflow.model.port import HasOType, NodeInput, NodeOutput, NodeOutputBP
 
 
 class DummyInputs:
@@ -22,6 +25,14 @@ class DummyNode:
         return DummyInputs()
 
 
+class DummyOType:
+    def __init__(self, name):
+        self.name = name
+
+    def get_requirements(self, additional_requirements):
+        return [self.name] + sorted(additional_requirements)
+
+
 class TestPorts(TestCase):
     def test_for_dtype(self):
         """The `dtype` attribute should always be present, although it may be None"""
@@ -56,3 +67,47 @@ class TestPorts(TestCase):
             self.assertTrue(p0.ready)
             p0.update(42)
             self.assertFalse(p0.ready, msg="Should be wrong type")
+
+    def test_downstream_requirements(self):
+        downstream = NodeInput(
+            node=SimpleNamespace(outputs=[]), otype=DummyOType("downstream")
+        )
+        upstream_node = SimpleNamespace(outputs=[])
+        upstream = NodeInput(node=upstream_node, otype=DummyOType("upstream"))
+        out = NodeOutput(node=upstream_node, otype=DummyOType("out"))
+        upstream_node.outputs.append(out)
+
+        out.connections.append(SimpleNamespace(inp=downstream))
+        HasOType._connections_changed()
+        self.assertListEqual(
+            ["upstream", "downstream"], upstream.get_downstream_requirements()
+        )
+
+        out.connections.clear()
+        HasOType._connections_changed()
+        self.assertListEqual(
+            ["upstream"],
+            upstream.get_downstream_requirements(),
+            msg="Cached requirements should be dropped when connections change"
+        )
+
+    def test_output_dtype_serialization(self):
+        out = NodeOutput(node=None, dtype=Choice(items=["foo"], valid_classes=str))
+        out.data()
+        out.dtype.items.append("bar")
+        out.dtype.batched = True
+        state = deserialize(out.data()["dtype state"])
+        self.assertListEqual(
+            ["foo", "bar"], state["items"], msg="Changes should not be missed"
+        )
+        self.assertTrue(state["batched"])
+
+        out.dtype.items = [0, 1]
+        out.data()
+        out.dtype.items = [False, True]
+        self.assertListEqual(
+            [False, True],
+            deserialize(out.data()["dtype state"])["items"],
+            msg="Changes in type should not be missed, even when values compare equal",
+        )
+        self.assertIs(bool, type(deserialize(out.data()["dtype state"])["items"][0]))